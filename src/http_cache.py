@@ -0,0 +1,132 @@
+"""
+HTTP cache module - On-disk cache enabling conditional GETs between runs
+"""
+
+import time
+import sqlite3
+import threading
+from typing import Optional, Tuple
+from utils import logger
+
+CACHE_DB = 'scraper_cache.db'
+MAX_CACHE_ROWS = 2000 # least-recently-used entries are pruned past this
+
+class HTTPCache:
+    """
+    Small sqlite-backed cache of response bodies keyed by URL.
+
+    Stores the validators (ETag / Last-Modified) a server sent alongside
+    the body, so a periodic re-run can issue conditional GETs and reuse
+    the cached body on a 304 Not Modified instead of re-downloading.
+    Pages without validators are not cached since they can never be
+    revalidated.
+
+    The database file is opened lazily on first use (not at import),
+    and the row count is capped - storing a new entry evicts the least
+    recently used ones past MAX_CACHE_ROWS so the file can't grow
+    without bound across cycles.
+    """
+
+    def __init__(self, db_path: str = CACHE_DB, max_rows: int = MAX_CACHE_ROWS):
+        self._db_path = db_path
+        self._max_rows = max_rows
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """Open the database on first use. Callers must hold the lock."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+                'body BLOB, last_used REAL)'
+            )
+            # Databases created before the LRU cap lack the last_used column
+            try:
+                self._conn.execute('ALTER TABLE responses ADD COLUMN last_used REAL')
+            except sqlite3.OperationalError:
+                pass
+            self._conn.commit()
+        return self._conn
+
+    def lookup(self, url: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Look up a cached response, refreshing its recency.
+
+        Args:
+            url: The URL to look up
+
+        Returns:
+            Tuple of (etag, last_modified, body) or None if not cached
+        """
+        with self._lock:
+            conn = self._get_conn()
+            row = conn.execute(
+                'SELECT etag, last_modified, body FROM responses WHERE url = ?',
+                (url,)
+            ).fetchone()
+            if row:
+                conn.execute('UPDATE responses SET last_used = ? WHERE url = ?',
+                             (time.time(), url))
+                conn.commit()
+        return row
+
+    def conditional_headers(self, url: str) -> dict:
+        """
+        Build If-None-Match / If-Modified-Since headers for a URL.
+
+        Args:
+            url: The URL about to be fetched
+
+        Returns:
+            Dictionary of conditional request headers (possibly empty)
+        """
+        headers = {}
+        cached = self.lookup(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def store(self, url: str, etag: Optional[str], last_modified: Optional[str],
+              body: bytes) -> None:
+        """
+        Store a response body with its validators, evicting LRU entries.
+
+        Args:
+            url: The URL the body came from
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            body: Raw response body
+        """
+        if not etag and not last_modified:
+            # Nothing to revalidate against later - not worth storing
+            return
+
+        with self._lock:
+            try:
+                conn = self._get_conn()
+                conn.execute(
+                    'INSERT OR REPLACE INTO responses '
+                    '(url, etag, last_modified, body, last_used) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (url, etag, last_modified, body, time.time())
+                )
+
+                # Keep the cache bounded - drop whatever hasn't been
+                # touched longest once past the row cap
+                excess = conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0] - self._max_rows
+                if excess > 0:
+                    conn.execute(
+                        'DELETE FROM responses WHERE url IN ('
+                        'SELECT url FROM responses ORDER BY last_used LIMIT ?)',
+                        (excess,)
+                    )
+
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to cache response for {url}: {e}")
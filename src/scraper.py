@@ -4,11 +4,11 @@ News Article Scraper - Main module
 
 import argparse
 import sys
-import time
 import logging
-from utils import logger, load_config, init_sources, get_settings
-from article_scraper import scrape_source, get_article_urls, extract_article
-from storage import load_existing_articles, save_articles
+from datetime import datetime
+from utils import logger, load_config, init_sources, get_settings, canonicalize_url
+from article_scraper import scrape_all_sources, get_article_urls, extract_article
+from storage import load_existing_urls, save_articles
 
 def main():
     """Main entry point for the news scraper."""
@@ -49,7 +49,7 @@ def main():
             logger.info(f"Will save to CSV after every {save_interval} articles")
         
         output_csv = settings['output_csv']
-        existing_articles = load_existing_articles(output_csv)
+        existing_urls = load_existing_urls(output_csv)
         
         if args.source:
             if args.source in sources:
@@ -60,14 +60,17 @@ def main():
                 return 1
         
         all_articles = []
+        # Articles extracted since the last checkpoint save - only these
+        # need filtering and writing at each checkpoint, not the whole run
+        pending_articles = []
         articles_since_save = 0
-        
-        for source_name, source_config in sources.items():
-            try:
-                logger.info(f"Processing source: {source_name}")
-                
-                # If using incremental save, we'll handle articles one by one
-                if save_interval > 0:
+
+        if save_interval > 0:
+            # Incremental save - handle sources and articles one by one
+            for source_name, source_config in sources.items():
+                try:
+                    logger.info(f"Processing source: {source_name}")
+
                     # Get article URLs
                     max_articles = source_config.get('max_articles', settings.get('max_articles_per_source'))
                     
@@ -79,10 +82,7 @@ def main():
                     )
                     
                     start_date_str = settings.get('start_date')
-                    start_date = None
-                    if start_date_str:
-                        from datetime import datetime
-                        start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
+                    start_date = datetime.fromisoformat(start_date_str) if start_date_str else None
                     
                     source_articles = []
                     
@@ -98,18 +98,19 @@ def main():
                         if article_data:
                             source_articles.append(article_data)
                             all_articles.append(article_data)
+                            pending_articles.append(article_data)
                             articles_since_save += 1
-                            
+
                             logger.info(f"Extracted article: {article_data['title']}")
-                            
-                            if save_interval > 0 and articles_since_save >= save_interval:
-                                num_saved = save_articles(all_articles, output_csv, existing_articles)
+
+                            if articles_since_save >= save_interval:
+                                num_saved = save_articles(pending_articles, output_csv, existing_urls)
                                 logger.info(f"Checkpoint save: Added {num_saved} new articles to {output_csv}")
-                                
-                                for article in all_articles:
-                                    existing_articles[article['url']] = article
-                                
+
+                                existing_urls.update(canonicalize_url(article['url']) for article in pending_articles)
+
                                 # counter reset
+                                pending_articles = []
                                 articles_since_save = 0
                             
                             # if we've reached the maximum number of articles for this source
@@ -117,23 +118,20 @@ def main():
                                 logger.info(f"Reached maximum limit of {max_articles} articles for {source_name}")
                                 break
                         
-                        # let us not bombard our sources
-                        time.sleep(float(settings.get('request_delay', 1.0)))
-                    
                     logger.info(f"Scraped {len(source_articles)} articles from {source_name}")
-                    
-                else:
-                    # OG approach - get all articles at once
-                    articles = scrape_source(source_name, source_config, settings)
-                    all_articles.extend(articles)
-                    logger.info(f"Scraped {len(articles)} articles from {source_name}")
-                
-            except Exception as e:
-                logger.error(f"Error scraping source {source_name}: {e}")
-        
+
+                except Exception as e:
+                    logger.error(f"Error scraping source {source_name}: {e}")
+
+        else:
+            # OG approach - get all articles at once, sources in parallel
+            all_articles = scrape_all_sources(sources, settings)
+
+
         # save of any remaining articles
-        if all_articles and (articles_since_save > 0 or save_interval == 0):
-            num_new = save_articles(all_articles, output_csv, existing_articles)
+        remaining = pending_articles if save_interval > 0 else all_articles
+        if remaining:
+            num_new = save_articles(remaining, output_csv, existing_urls)
             logger.info(f"Scraping completed. Added {num_new} new articles to {output_csv}")
     
     except Exception as e:
@@ -143,5 +141,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    import logging  
     sys.exit(main())
\ No newline at end of file
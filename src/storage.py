@@ -4,80 +4,135 @@ Data storage module - Handles saving and loading article data
 
 import os
 import csv
-import pandas as pd
-from utils import logger
-from typing import Dict, List, Any
+import hashlib
+from utils import canonicalize_url, logger
+from typing import List, Set, Dict, Any, Optional
 
-def load_existing_articles(csv_path: str) -> Dict[str, Dict[str, Any]]:
+# Column schema of the articles CSV
+FIELDNAMES = ('title', 'author', 'content', 'source', 'url', 'date')
+
+# Fingerprints of article bodies saved by this process - catches the
+# same story reappearing under a different URL (redirects, changed
+# slugs) within a run, which URL-equality dedup misses
+_seen_content_hashes = set()
+
+def _content_fingerprint(article: Dict[str, Any]) -> Optional[str]:
     """
-    Load existing articles from a CSV file.
-    
+    Hash the whitespace-normalized article content.
+
+    Args:
+        article: Article dictionary
+
+    Returns:
+        Hex digest, or None when there is no content to fingerprint
+    """
+    normalized = ' '.join((article.get('content') or '').split())
+    if not normalized:
+        return None
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+def load_existing_urls(csv_path: str) -> Set[str]:
+    """
+    Load the URLs of existing articles from a CSV file.
+
+    Only the url column is read - membership testing is all the save
+    path needs, and skipping the other six columns keeps memory flat
+    as the corpus grows.
+
     Args:
         csv_path: Path to the CSV file
-        
+
     Returns:
-        Dictionary mapping article URLs to their data
+        Set of article URLs already on disk
     """
-    existing = {}
-    
-    if os.path.exists(csv_path):
-        try:
-            df = pd.read_csv(csv_path)
-            for _, row in df.iterrows():
-                existing[row['url']] = row.to_dict()
-                
-            logger.info(f"Loaded {len(existing)} existing articles from {csv_path}")
-        except Exception as e:
-            logger.error(f"Error loading existing articles from {csv_path}: {e}")
-    else:
+    existing = set()
+
+    # Missing or header-only files skip the parse - and on fresh runs
+    # the pandas import along with it
+    if not os.path.exists(csv_path) or os.path.getsize(csv_path) < 64:
         logger.info(f"No existing articles file found at {csv_path}")
-    
+        return existing
+
+    try:
+        import pandas as pd
+
+        urls = pd.read_csv(csv_path, usecols=['url'], engine='c',
+                           dtype={'url': 'string'}, memory_map=True)['url']
+        # dropna so a malformed row can't abort the load and silently
+        # disable dedup for the whole run
+        existing = {canonicalize_url(u) for u in urls.dropna()}
+
+        logger.info(f"Loaded {len(existing)} existing article URLs from {csv_path}")
+    except Exception as e:
+        logger.error(f"Error loading existing articles from {csv_path}: {e}")
+
     return existing
 
-def save_articles(articles: List[Dict[str, Any]], csv_path: str, 
-                 existing_articles: Dict[str, Dict[str, Any]] = None) -> int:
+def save_articles(articles: List[Dict[str, Any]], csv_path: str,
+                 existing_urls: Set[str] = None) -> int:
     """
-    Save articles to a CSV file, avoiding duplicates.
-    
+    Append new articles to a CSV file, avoiding duplicates.
+
+    Only the new rows are written - the existing file is never
+    re-read or rewritten, so each save costs O(new articles) instead
+    of O(corpus).
+
     Args:
         articles: List of article dictionaries to save
         csv_path: Path to the CSV file
-        existing_articles: Dictionary of existing articles
-        
+        existing_urls: Set of URLs already saved
+
     Returns:
         Number of new articles saved
     """
     if not articles:
         logger.info("No articles to save")
         return 0
-    
-    if existing_articles is None:
-        existing_articles = load_existing_articles(csv_path)
-    
+
+    if existing_urls is None:
+        existing_urls = load_existing_urls(csv_path)
+
     new_articles = []
+    batch_urls = set()
     for article in articles:
-        if article['url'] not in existing_articles:
-            new_articles.append(article)
-    
+        # Dedup on the canonical form so slug/tracking-param variants
+        # of the same article collapse; the stored row keeps the raw URL
+        url_key = canonicalize_url(article['url'])
+        if url_key in existing_urls or url_key in batch_urls:
+            continue
+        batch_urls.add(url_key)
+
+        fingerprint = _content_fingerprint(article)
+        if fingerprint in _seen_content_hashes:
+            logger.info(f"Skipping duplicate content: {article['url']}")
+            continue
+        if fingerprint:
+            _seen_content_hashes.add(fingerprint)
+
+        new_articles.append(article)
+
     if not new_articles:
         logger.info("No new articles to save")
         return 0
-    
+
     try:
-        all_articles = list(existing_articles.values()) + new_articles
-        
-        df = pd.DataFrame(all_articles)
-        
-        required_columns = ['title', 'author', 'content', 'source', 'url', 'date']
-        for col in required_columns:
-            if col not in df.columns:
-                df[col] = ''
-        
-        df.to_csv(csv_path, index=False, quoting=csv.QUOTE_ALL)
+        write_header = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+
+        # Plain csv writer with a large buffer - no DataFrame round
+        # trip just to serialize a handful of dicts. The fixed schema
+        # fills missing fields with '' and drops unknown keys, so no
+        # per-save column patching is needed
+        with open(csv_path, 'a', newline='', buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES, restval='',
+                                    extrasaction='ignore', quoting=csv.QUOTE_ALL)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(new_articles)
+
         logger.info(f"Saved {len(new_articles)} new articles to {csv_path}")
-        
+
         return len(new_articles)
-        
+
     except Exception as e:
         logger.error(f"Error saving articles to {csv_path}: {e}")
-        return 0
\ No newline at end of file
+        return 0
@@ -2,70 +2,137 @@
 Utility functions for the news scraper
 """
 
+import os
+import copy
 import yaml
 import logging
-import copy
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that identify a campaign or referrer, not content
+_TRACKING_PARAMS = {'gclid', 'fbclid', 'mc_cid', 'mc_eid', 'ref'}
+
+# libyaml's C loader parses ~10x faster than the pure-Python one; fall
+# back when PyYAML was built without it, or when explicitly forced for
+# debugging
+if os.environ.get('PERIODIC_SCRAPER_FORCE_PYYAML'):
+    _YAML_LOADER = yaml.SafeLoader
+else:
+    _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Formatter singletons - built once, shared by every setup call
+_FILE_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_CONSOLE_FORMATTER = logging.Formatter('%(levelname)s - %(message)s')
 
 def setup_logger(log_file='scraper.log', console_level=logging.INFO, file_level=logging.DEBUG):
     """
     Set up and configure the logger.
-    
+
     Args:
         log_file: Path to the log file
         console_level: Logging level for console output
         file_level: Logging level for file output
-        
+
     Returns:
         Configured logger
     """
     # Create logger
     logger = logging.getLogger("news_scraper")
-    
+
     # Check if handlers are already configured to avoid duplicate handlers
     if logger.handlers:
         return logger
-        
+
     logger.setLevel(logging.DEBUG)  # Set to lowest level to capture everything
-    
-    # Create formatters
-    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_formatter = logging.Formatter('%(levelname)s - %(message)s')
-    
-    # Create file handler
-    file_handler = logging.FileHandler(log_file)
+
+    # Records stop here - the root logger's handlers would double-emit
+    logger.propagate = False
+
+    # Create file handler; delay=True defers opening the file until
+    # something actually logs
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setLevel(file_level)
-    file_handler.setFormatter(file_formatter)
-    
+    file_handler.setFormatter(_FILE_FORMATTER)
+
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
-    console_handler.setFormatter(console_formatter)
-    
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
+
     # Add handlers to logger
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
-    
+
     return logger
 
 logger = setup_logger()
 
+@lru_cache(maxsize=8)
+def _load_config_cached(abs_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a config file; mtime in the key invalidates stale entries."""
+    with open(abs_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL into its deduplication key.
+
+    Lowercases the scheme and host, drops the fragment, default ports,
+    tracking query parameters (utm_*, gclid, fbclid, ...) and trailing
+    slashes, and sorts the remaining query parameters so their order
+    doesn't create distinct keys. Articles keep their raw URL in the
+    stored row - only dedup uses the canonical form.
+
+    Args:
+        url: The URL to normalize
+
+    Returns:
+        Canonical URL string
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == 'http' and netloc.endswith(':80')) or \
+       (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    params = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith('utm_') and k not in _TRACKING_PARAMS
+    )
+
+    path = parts.path.rstrip('/')
+
+    return urlunsplit((scheme, netloc, path, urlencode(params), ''))
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from a YAML file.
-    
+
+    Repeated loads of an unchanged file (e.g. every scheduler cycle)
+    reuse the parsed dict instead of re-tokenizing the YAML. Callers
+    get their own copy - get_settings and friends apply defaults in
+    place, which must never leak into the cached parse (a scheduler
+    cycle would otherwise inherit the previous cycle's derived
+    start_date instead of re-deriving it).
+
     Args:
         config_path: Path to the YAML configuration file
-        
+
     Returns:
         Dictionary containing the configuration
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            logger.info(f"Loaded configuration from {config_path}")
-            return config
+        abs_path = os.path.abspath(config_path)
+        config = _load_config_cached(abs_path, os.path.getmtime(abs_path))
+        logger.info(f"Loaded configuration from {config_path}")
+        return copy.deepcopy(config)
     except Exception as e:
         logger.error(f"Failed to load configuration: {e}")
         raise
@@ -90,8 +157,12 @@ def resolve_source_inheritance(sources: Dict[str, Any], common_configs: Dict[str
         # Check if this source inherits from a common config
         inherit_from = source_config.get('inherit')
         if inherit_from and inherit_from in common_configs:
-            # Start with the common config as base
-            resolved_config.update(copy.deepcopy(common_configs[inherit_from]))
+            # Start with the common config as base. A one-level clone of
+            # nested dicts (headers etc.) is all the isolation sources
+            # need - deepcopy walked every node with a memo table per
+            # source for the same result on these flat string configs
+            for key, value in common_configs[inherit_from].items():
+                resolved_config[key] = dict(value) if isinstance(value, dict) else value
         
         # Update with source-specific config, overriding inherited values if needed
         for key, value in source_config.items():
@@ -156,8 +227,9 @@ def get_settings(config: Dict[str, Any]) -> Dict[str, Any]:
     
     if 'start_date' in settings:
         try:
-            # Convert to datetime object to validate format
-            start_date = datetime.strptime(settings['start_date'], "%Y-%m-%d")
+            # Convert to datetime object to validate format - the C
+            # fromisoformat fast path beats strptime's format walk
+            start_date = datetime.fromisoformat(settings['start_date'])
             logger.info(f"Filtering articles from {start_date.strftime('%Y-%m-%d')}")
         except ValueError as e:
             logger.warning(f"Invalid start_date format: {e}. Using current date.")